@@ -34,30 +34,338 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
+import stat
 import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-
-from skill_scanner import SkillScanner
-from skill_scanner.core.analyzers.behavioral_analyzer import BehavioralAnalyzer
-from skill_scanner.core.analyzers.static import StaticAnalyzer
-from skill_scanner.core.models import Severity
-
-
-def get_severity_emoji(severity: Severity) -> str:
-    """Get emoji for severity level."""
-    severity_emojis = {
-        Severity.CRITICAL: "🔴",
-        Severity.HIGH: "🟠",
-        Severity.MEDIUM: "🟡",
-        Severity.LOW: "🔵",
-        Severity.INFO: "⚪",
-        Severity.SAFE: "✅",
-    }
-    return severity_emojis.get(severity, "❓")
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: faster C serializer, stdlib json otherwise
+    orjson = None
+
+# skill_scanner pulls in YARA and the analyzer stack, so it is imported lazily
+# (after argument parsing) to keep --help and argument errors fast.
+if TYPE_CHECKING:
+    from skill_scanner.core.models import Severity
+
+
+# (severity value, emoji, report count attribute), highest severity first.
+# Shared by the console breakdown, the finding printer and both report writers.
+# Keyed by the severity's string value so no skill_scanner import is needed.
+_SEV_ROWS = (
+    ("CRITICAL", "🔴", "critical_count"),
+    ("HIGH", "🟠", "high_count"),
+    ("MEDIUM", "🟡", "medium_count"),
+    ("LOW", "🔵", "low_count"),
+    ("INFO", "⚪", "info_count"),
+)
+
+_SEVERITY_ORDER = tuple(sev for sev, _, _ in _SEV_ROWS)
+
+_SEVERITY_EMOJI = {sev: emoji for sev, emoji, _ in _SEV_ROWS}
+_SEVERITY_EMOJI["SAFE"] = "✅"
+
+
+class _SeverityStrings(dict):
+    """Severity -> value string, filled on first use of each member."""
+
+    def __missing__(self, severity):
+        value = self[severity] = severity.value
+        return value
+
+
+# Pre-bound severity strings; enum .value goes through descriptor lookup
+_SEV_STR = _SeverityStrings()
+
+# Severity breakdown templates for the console and the markdown table
+_SEV_LINE_TMPL = "  {emoji} {label}: {count}".format
+_SEV_TABLE_ROW_TMPL = "| {emoji} {label} | {count} |\n".format
+
+# Longest code snippet excerpt included per finding in the markdown report
+_MD_SNIPPET_CHARS = 200
+
+
+def get_severity_emoji(severity: "Severity | str") -> str:
+    """Get emoji for a severity level or its string value.
+
+    Internal callers index _SEVERITY_EMOJI directly; this stays as the
+    public helper.
+    """
+    return _SEVERITY_EMOJI.get(getattr(severity, "value", severity), "❓")
+
+
+def build_analyzers(use_behavioral: bool, use_llm: bool) -> list:
+    """Build the analyzer pipeline used for each skill.
+
+    The LLM analyzer stays in the same scanner as the local analyzers so the
+    library runs it as its enriched second phase over their findings.
+    """
+    from skill_scanner.core.analyzers.behavioral_analyzer import BehavioralAnalyzer
+    from skill_scanner.core.analyzers.static import StaticAnalyzer
+
+    analyzers = [StaticAnalyzer()]
+
+    if use_behavioral:
+        analyzers.append(BehavioralAnalyzer(use_static_analysis=True))
+
+    if use_llm:
+        from skill_scanner.core.analyzers.llm_analyzer import LLMAnalyzer
+        analyzers.append(LLMAnalyzer())
+
+    return analyzers
+
+
+# Scanner owned by the current worker (process or thread). Analyzers don't
+# pickle reliably, so each worker builds its own once in the pool initializer.
+_worker = threading.local()
+
+
+def _init_worker(use_behavioral: bool, use_llm: bool):
+    """Create the scanner for this worker."""
+    from skill_scanner import SkillScanner
+
+    _worker.scanner = SkillScanner(analyzers=build_analyzers(use_behavioral, use_llm))
+
+
+def _scan_one(skill_path: Path):
+    """Scan a single skill directory with this worker's scanner.
+
+    Returns ``(result, None)``, or ``(None, reason)`` if the skill failed to
+    load or scan, so one bad skill doesn't abort the whole run.
+    """
+    from skill_scanner.core.loader import SkillLoadError
+
+    try:
+        return _worker.scanner.scan_skill(skill_path), None
+    except SkillLoadError as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def scan_skills(
+    skills: List[Path],
+    use_behavioral: bool,
+    use_llm: bool,
+    jobs: int,
+) -> list:
+    """Scan skill directories, fanning out to a worker pool when jobs > 1.
+
+    The static analyzer is mostly file I/O plus YARA matching, which releases
+    the GIL, so static-only scans use threads and skip process start-up and
+    result pickling. Behavioral analysis is pure-Python AST work and needs
+    processes to run in parallel. LLM requests are network-bound and overlap
+    across however many workers the pool has.
+
+    Skills that fail to load or scan are reported with a warning and come
+    back as None, in the same position as their input.
+    """
+    if not skills:
+        return []
+
+    if jobs > 1:
+        executor_cls = ProcessPoolExecutor if use_behavioral else ThreadPoolExecutor
+        with executor_cls(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(use_behavioral, use_llm),
+        ) as executor:
+            outcomes = list(executor.map(_scan_one, skills))
+    else:
+        _init_worker(use_behavioral, use_llm)
+        outcomes = [_scan_one(skill) for skill in skills]
+
+    scan_results = []
+    for skill, (result, reason) in zip(skills, outcomes):
+        if result is None:
+            print(f"⚠️  Warning: Skipping {skill.name}: {reason}")
+        scan_results.append(result)
+    return scan_results
+
+
+def skill_fingerprint(skill_path: Path, skills_dir: Path, analyzer_key: str) -> str:
+    """Hash a skill's location, files (relative path + contents) and the analyzer key.
+
+    Raises OSError if a file in the skill can't be read (e.g. a dangling
+    symlink); such skills are scanned without caching.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    location = os.path.relpath(skill_path, skills_dir).replace(os.sep, "/").encode()
+    for part in (analyzer_key.encode(), location):
+        hasher.update(len(part).to_bytes(8, "little"))
+        hasher.update(part)
+
+    files = []
+    for dirpath, _, filenames in os.walk(skill_path):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            files.append((os.path.relpath(full, skill_path).replace(os.sep, "/"), full))
+
+    for rel_path, full in sorted(files):
+        # Length-prefix each part so renames and content shifts change the hash
+        rel = rel_path.encode()
+        with open(full, 'rb') as f:
+            data = f.read()
+        hasher.update(len(rel).to_bytes(8, "little"))
+        hasher.update(rel)
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+
+    return hasher.hexdigest()
+
+
+def _scan_result_from_dict(data: dict):
+    """Rebuild a ScanResult from its ScanResult.to_dict() form."""
+    from skill_scanner.core.models import Finding, ScanResult, Severity, ThreatCategory
+
+    def finding(d):
+        return Finding(**{**d, "severity": Severity(d["severity"]), "category": ThreatCategory(d["category"])})
+
+    return ScanResult(
+        skill_name=data["skill_name"],
+        skill_directory=data["skill_path"],
+        findings=[finding(d) for d in data["findings"]],
+        suppressed_findings=[finding(d) for d in data.get("suppressed_findings", [])],
+        scan_duration_seconds=data["scan_duration_seconds"],
+        analyzers_used=data["analyzers_used"],
+        analyzers_failed=data.get("analyzers_failed", []),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        scan_metadata=data.get("scan_metadata") or None,
+        llm_usage=data.get("llm_usage"),
+    )
+
+
+class SkillResultCache:
+    """Persistent per-skill scan result cache with a TTL and LFU eviction.
+
+    Results are stored as JSON in ``<cache_dir>/<fingerprint>.json`` (never
+    pickled, so a planted entry can't run code) and hit counts are kept in
+    ``index.json``. Entries older than ``ttl`` seconds count as misses; once
+    more than ``max_entries`` results are stored, the least frequently used
+    ones are evicted on save.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float, max_entries: int = 512):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._index_path = cache_dir / "index.json"
+        try:
+            self._hits = json.loads(self._index_path.read_text())
+        except (OSError, ValueError):
+            self._hits = {}
+
+    def _entry_path(self, fingerprint: str) -> Path:
+        return self.cache_dir / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str):
+        """Return the cached result for a fingerprint, or None on a miss."""
+        if fingerprint not in self._hits:
+            return None
+        path = self._entry_path(fingerprint)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                raise ValueError("stale entry")
+            result = _scan_result_from_dict(json.loads(path.read_bytes()))
+        except Exception:
+            # Missing, stale or unreadable entry (e.g. written by another library version)
+            del self._hits[fingerprint]
+            return None
+        self._hits[fingerprint] += 1
+        return result
+
+    def put(self, fingerprint: str, result):
+        """Store a freshly scanned result (raises OSError if it can't be written)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entry_path(fingerprint).write_bytes(_dumps(result.to_dict(), pretty=False))
+        self._hits[fingerprint] = self._hits.get(fingerprint, 0) + 1
+
+    def save(self):
+        """Evict least frequently used entries and persist the hit index."""
+        excess = len(self._hits) - self.max_entries
+        if excess > 0:
+            for fingerprint in sorted(self._hits, key=self._hits.get)[:excess]:
+                self._entry_path(fingerprint).unlink(missing_ok=True)
+                del self._hits[fingerprint]
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path.write_text(json.dumps(self._hits))
+
+
+def discover_skills(skills_dir: Path, recursive: bool) -> List[Path]:
+    """Find skill directories (those containing a SKILL.md) under skills_dir.
+
+    Walks with os.scandir so entry types come from the directory listing
+    instead of a separate stat per path. Symlinked directories are checked
+    for a SKILL.md but never descended into. A skill reachable through more
+    than one path (e.g. a symlink to a sibling) is returned once, under the
+    first path in sorted order.
+    """
+    root = os.fspath(skills_dir)
+    found = []
+    stack = [(root, recursive)]
+
+    while stack:
+        current, descend = stack.pop()
+        has_skill_md = False
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == "SKILL.md":
+                        has_skill_md = entry.is_file()
+                    elif entry.is_dir() and (descend or current == root):
+                        stack.append((entry.path, descend and not entry.is_symlink()))
+        except OSError:
+            continue
+
+        if has_skill_md and (recursive or current != root):
+            found.append(current)
+
+    skills = []
+    seen = set()
+    for path in sorted(found):
+        real = os.path.realpath(path)
+        if real not in seen:
+            seen.add(real)
+            skills.append(Path(path))
+    return skills
+
+
+def _severity_histogram(scan_results: list) -> Counter:
+    """Count findings per severity value in a single pass."""
+    return Counter(
+        _SEV_STR[finding.severity]
+        for result in scan_results
+        for finding in result.findings
+    )
+
+
+def aggregate_report(scan_results: list) -> SimpleNamespace:
+    """Merge per-skill scan results into the report shape used downstream.
+
+    ``severity_histogram`` maps severity values to finding counts; the
+    ``*_count`` attributes mirror it for code expecting the library report.
+    """
+    histogram = _severity_histogram(scan_results)
+
+    return SimpleNamespace(
+        scan_results=scan_results,
+        total_skills_scanned=len(scan_results),
+        safe_count=sum(1 for result in scan_results if result.is_safe),
+        total_findings=sum(len(result.findings) for result in scan_results),
+        severity_histogram=histogram,
+        **{attr: histogram[sev] for sev, _, attr in _SEV_ROWS},
+    )
 
 
 def print_banner():
@@ -69,185 +377,218 @@ def print_banner():
     print()
 
 
-def print_finding_details(result):
-    """Print detailed findings for a scan result."""
+def print_finding_details(result, buf: Optional[list] = None):
+    """Print detailed findings for a scan result.
+
+    Lines are collected in ``buf`` when one is given so the caller can emit
+    them together; otherwise they are written to stdout in a single call.
+    """
+    out = [] if buf is None else buf
+    _a = out.append
+
     if not result.findings:
-        print(f"  ✅ No security issues found\n")
-        return
-
-    # Group findings by severity
-    findings_by_severity = {
-        Severity.CRITICAL: [],
-        Severity.HIGH: [],
-        Severity.MEDIUM: [],
-        Severity.LOW: [],
-        Severity.INFO: [],
-    }
+        _a("  ✅ No security issues found\n\n")
+    else:
+        # Group findings by severity in a single pass
+        findings_by_severity = defaultdict(list)
+        for finding in result.findings:
+            findings_by_severity[_SEV_STR[finding.severity]].append(finding)
 
-    for finding in result.findings:
-        if finding.severity in findings_by_severity:
-            findings_by_severity[finding.severity].append(finding)
+        # Print findings by severity (highest first)
+        for severity in _SEVERITY_ORDER:
+            findings = findings_by_severity.get(severity)
+            if not findings:
+                continue
 
-    # Print findings by severity (highest first)
-    for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
-        findings = findings_by_severity[severity]
-        if not findings:
-            continue
+            sev_emoji = _SEVERITY_EMOJI[severity]
+
+            _a(f"\n  {sev_emoji} {severity} Findings ({len(findings)}):\n")
+            _a("  " + "-" * 76 + "\n")
 
-        print(f"\n  {get_severity_emoji(severity)} {severity.value} Findings ({len(findings)}):")
-        print("  " + "-" * 76)
+            for finding in findings:
+                _a(f"\n    [{severity}] {finding.title}\n")
+                _a(f"    Rule: {finding.rule_id}\n")
 
-        for finding in findings:
-            print(f"\n    [{finding.severity.value}] {finding.title}")
-            print(f"    Rule: {finding.rule_id}")
+                if finding.description:
+                    # Show the first non-blank line of the description
+                    first_line = next(
+                        (line for line in finding.description.splitlines() if line.strip()),
+                        None,
+                    )
+                    if first_line:
+                        _a(f"    Description: {first_line.strip()}\n")
 
-            if finding.description:
-                # Wrap description
-                desc_lines = finding.description.split('\n')
-                for line in desc_lines:
-                    if line.strip():
-                        print(f"    Description: {line.strip()}")
-                        break
+                if finding.file_path:
+                    location = f"    Location: {finding.file_path}"
+                    if finding.line_number:
+                        location += f":{finding.line_number}"
+                    _a(location + "\n")
 
-            if finding.file_path:
-                location = f"    Location: {finding.file_path}"
-                if finding.line_number:
-                    location += f":{finding.line_number}"
-                print(location)
+                snippet = finding.snippet
+                if snippet:
+                    # Show first line of snippet
+                    head = snippet.partition('\n')[0]
+                    snippet_preview = head[:60] + ("..." if len(snippet) > 60 else "")
+                    _a(f"    Snippet: {snippet_preview}\n")
 
-            if finding.snippet:
-                # Show first line of snippet
-                snippet_preview = finding.snippet.split('\n')[0][:60]
-                if len(finding.snippet) > 60:
-                    snippet_preview += "..."
-                print(f"    Snippet: {snippet_preview}")
+    if buf is None:
+        sys.stdout.write("".join(out))
 
 
 def print_summary_table(report):
     """Print summary table of all scanned skills."""
-    print("\n" + "=" * 80)
-    print("SUMMARY TABLE")
-    print("=" * 80)
-    print(f"{'Skill Name':<30} {'Status':<10} {'Severity':<10} {'Findings':<10}")
-    print("-" * 80)
+    buf = [
+        "\n" + "=" * 80 + "\n",
+        "SUMMARY TABLE\n",
+        "=" * 80 + "\n",
+        f"{'Skill Name':<30} {'Status':<10} {'Severity':<10} {'Findings':<10}\n",
+        "-" * 80 + "\n",
+    ]
+    _a = buf.append
 
     for result in report.scan_results:
         status = "✅ SAFE" if result.is_safe else "⚠️  UNSAFE"
-        severity_indicator = get_severity_emoji(result.max_severity)
+        max_severity = _SEV_STR[result.max_severity]
+        severity_indicator = _SEVERITY_EMOJI.get(max_severity, "❓")
         findings_count = len(result.findings)
 
-        print(f"{result.skill_name:<30} {status:<10} {severity_indicator} {result.max_severity.value:<8} {findings_count:<10}")
-
-    print("-" * 80)
-    print(f"{'TOTAL':<30} {report.total_skills_scanned} skills")
-    print()
-
-
-def save_json_report(report, output_path: Path):
-    """Save detailed JSON report."""
-    report_data = {
-        "scan_timestamp": datetime.now().isoformat(),
-        "summary": {
-            "total_skills": report.total_skills_scanned,
-            "safe_count": report.safe_count,
-            "unsafe_count": report.total_skills_scanned - report.safe_count,
-            "total_findings": report.total_findings,
-            "critical_count": report.critical_count,
-            "high_count": report.high_count,
-            "medium_count": report.medium_count,
-            "low_count": report.low_count,
-            "info_count": report.info_count,
-        },
-        "skills": []
+        _a(f"{result.skill_name:<30} {status:<10} {severity_indicator} {max_severity:<8} {findings_count:<10}\n")
+
+    _a("-" * 80 + "\n")
+    _a(f"{'TOTAL':<30} {report.total_skills_scanned} skills\n")
+    _a("\n")
+    sys.stdout.write("".join(buf))
+
+
+def _dumps(obj, pretty: bool) -> bytes:
+    """Serialize obj to JSON bytes (orjson when available), compact unless pretty."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _finding_dict(finding) -> dict:
+    """Convert a finding into its JSON report representation."""
+    return {
+        "title": finding.title,
+        "severity": _SEV_STR[finding.severity],
+        "rule_id": finding.rule_id,
+        "description": finding.description,
+        "file_path": str(finding.file_path) if finding.file_path else None,
+        "line_number": finding.line_number,
+        "snippet": finding.snippet,
+        "category": finding.category,
     }
 
+
+def _iter_skill_dicts(report):
+    """Yield one JSON-ready dict per skill, so only one is alive at a time."""
     for result in report.scan_results:
-        skill_data = {
+        yield {
             "name": result.skill_name,
             "is_safe": result.is_safe,
-            "max_severity": result.max_severity.value,
+            "max_severity": _SEV_STR[result.max_severity],
             "total_findings": len(result.findings),
-            "findings": []
+            "findings": [_finding_dict(finding) for finding in result.findings],
         }
 
-        for finding in result.findings:
-            finding_data = {
-                "title": finding.title,
-                "severity": finding.severity.value,
-                "rule_id": finding.rule_id,
-                "description": finding.description,
-                "file_path": str(finding.file_path) if finding.file_path else None,
-                "line_number": finding.line_number,
-                "snippet": finding.snippet,
-                "category": finding.category,
-            }
-            skill_data["findings"].append(finding_data)
-
-        report_data["skills"].append(skill_data)
-
-    with open(output_path, 'w') as f:
-        json.dump(report_data, f, indent=2)
+
+def save_json_report(report, output_path: Path, pretty: bool = False):
+    """Save detailed JSON report, writing one skill at a time."""
+    summary = {
+        "total_skills": report.total_skills_scanned,
+        "safe_count": report.safe_count,
+        "unsafe_count": report.total_skills_scanned - report.safe_count,
+        "total_findings": report.total_findings,
+    }
+    histogram = report.severity_histogram
+    for sev, _, attr in _SEV_ROWS:
+        summary[attr] = histogram[sev]
+
+    # Layout pieces; objects nested in the document are re-indented when pretty
+    if pretty:
+        colon, nl, level1, level2 = b': ', b'\n', b'\n  ', b'\n    '
+    else:
+        colon, nl, level1, level2 = b':', b'', b'', b''
+
+    def dump(obj, indent: bytes = b'') -> bytes:
+        data = _dumps(obj, pretty)
+        return data.replace(b'\n', b'\n' + indent) if pretty and indent else data
+
+    with open(output_path, 'wb') as f:
+        w = f.write
+        w(b'{' + level1 + b'"scan_timestamp"' + colon)
+        w(dump(datetime.now().isoformat()))
+        w(b',' + level1 + b'"summary"' + colon)
+        w(dump(summary, b'  '))
+        w(b',' + level1 + b'"skills"' + colon + b'[')
+
+        for i, skill_data in enumerate(_iter_skill_dicts(report)):
+            w((b',' if i else b'') + level2)
+            w(dump(skill_data, b'    '))
+
+        w((level1 + b']' if report.scan_results else b']') + nl + b'}')
 
     print(f"\n✅ JSON report saved to: {output_path}")
 
 
 def save_markdown_report(report, output_path: Path):
-    """Save detailed markdown report."""
-    md_lines = [
-        "# Claude Skills Security Scan Report",
-        f"\n**Scan Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        f"\n## Summary",
-        f"\n- **Total Skills Scanned:** {report.total_skills_scanned}",
-        f"- **Safe Skills:** {report.safe_count}",
-        f"- **Unsafe Skills:** {report.total_skills_scanned - report.safe_count}",
-        f"- **Total Findings:** {report.total_findings}",
-        f"\n### Severity Breakdown",
-        f"\n| Severity | Count |",
-        f"|----------|-------|",
-    ]
-
-    if report.critical_count > 0:
-        md_lines.append(f"| 🔴 CRITICAL | {report.critical_count} |")
-    if report.high_count > 0:
-        md_lines.append(f"| 🟠 HIGH | {report.high_count} |")
-    if report.medium_count > 0:
-        md_lines.append(f"| 🟡 MEDIUM | {report.medium_count} |")
-    if report.low_count > 0:
-        md_lines.append(f"| 🔵 LOW | {report.low_count} |")
-    if report.info_count > 0:
-        md_lines.append(f"| ⚪ INFO | {report.info_count} |")
-
-    md_lines.append("\n## Detailed Results\n")
-
-    for result in report.scan_results:
-        status = "✅ SAFE" if result.is_safe else "⚠️ UNSAFE"
-        md_lines.append(f"\n### {result.skill_name} - {status}")
-        md_lines.append(f"\n- **Max Severity:** {get_severity_emoji(result.max_severity)} {result.max_severity.value}")
-        md_lines.append(f"- **Total Findings:** {len(result.findings)}")
-
-        if result.findings:
-            md_lines.append("\n#### Findings\n")
-
-            for finding in result.findings:
-                md_lines.append(f"\n##### {get_severity_emoji(finding.severity)} [{finding.severity.value}] {finding.title}")
-                md_lines.append(f"\n- **Rule ID:** `{finding.rule_id}`")
-
-                if finding.description:
-                    md_lines.append(f"- **Description:** {finding.description}")
-
-                if finding.file_path:
-                    location = f"`{finding.file_path}`"
-                    if finding.line_number:
-                        location += f" (line {finding.line_number})"
-                    md_lines.append(f"- **Location:** {location}")
-
-                if finding.snippet:
-                    md_lines.append(f"- **Code Snippet:**\n  ```\n  {finding.snippet[:200]}\n  ```")
-
-    md_lines.append("\n---\n*Generated by Cisco AI Defense Skill Scanner*")
-
-    with open(output_path, 'w') as f:
-        f.write('\n'.join(md_lines))
+    """Save detailed markdown report, streaming it straight to the file."""
+    emoji_for = _SEVERITY_EMOJI.get
+
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        w = f.write
+        w("# Claude Skills Security Scan Report\n")
+        w(f"\n**Scan Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w("\n## Summary\n")
+        w(f"\n- **Total Skills Scanned:** {report.total_skills_scanned}\n")
+        w(f"- **Safe Skills:** {report.safe_count}\n")
+        w(f"- **Unsafe Skills:** {report.total_skills_scanned - report.safe_count}\n")
+        w(f"- **Total Findings:** {report.total_findings}\n")
+        w("\n### Severity Breakdown\n")
+        w("\n| Severity | Count |\n")
+        w("|----------|-------|\n")
+
+        histogram = report.severity_histogram
+        for label, emoji, _ in _SEV_ROWS:
+            count = histogram[label]
+            if count > 0:
+                w(_SEV_TABLE_ROW_TMPL(emoji=emoji, label=label, count=count))
+
+        w("\n## Detailed Results\n\n")
+
+        for result in report.scan_results:
+            status = "✅ SAFE" if result.is_safe else "⚠️ UNSAFE"
+            w(f"\n### {result.skill_name} - {status}\n")
+            max_severity = _SEV_STR[result.max_severity]
+            w(f"\n- **Max Severity:** {emoji_for(max_severity, '❓')} {max_severity}\n")
+            w(f"- **Total Findings:** {len(result.findings)}\n")
+
+            if result.findings:
+                w("\n#### Findings\n\n")
+
+                for finding in result.findings:
+                    severity = _SEV_STR[finding.severity]
+                    w(f"\n##### {emoji_for(severity, '❓')} [{severity}] {finding.title}\n")
+                    w(f"\n- **Rule ID:** `{finding.rule_id}`\n")
+
+                    if finding.description:
+                        w(f"- **Description:** {finding.description}\n")
+
+                    if finding.file_path:
+                        location = f"`{finding.file_path}`"
+                        if finding.line_number:
+                            location += f" (line {finding.line_number})"
+                        w(f"- **Location:** {location}\n")
+
+                    snippet = finding.snippet
+                    if snippet:
+                        excerpt = snippet[:_MD_SNIPPET_CHARS]
+                        w(f"- **Code Snippet:**\n  ```\n  {excerpt}\n  ```\n")
+
+        w("\n---\n*Generated by Cisco AI Defense Skill Scanner*\n")
 
     print(f"✅ Markdown report saved to: {output_path}")
 
@@ -304,29 +645,83 @@ def main():
         help="Scan skills recursively (default: True)"
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of parallel scan workers (default: min(skill count, CPU count))"
+    )
+
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=16,
+        help="Default number of scan workers when the LLM analyzer is enabled (default: 16)"
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Reuse results for unchanged skills from this directory (default: no cache)"
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=86400,
+        help="Seconds a cached skill result stays valid (default: 86400)"
+    )
+
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Indent the JSON report (default: compact output)"
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Skip per-finding console output (implied when writing a report to a non-TTY stdout without --fail-on-findings)"
+    )
+
     args = parser.parse_args()
 
     # Resolve skills directory path
-    skills_dir = Path(args.skills_dir)
-    if not skills_dir.is_absolute():
-        skills_dir = Path.cwd() / skills_dir
-
-    if not skills_dir.exists():
+    skills_dir = Path(os.path.abspath(args.skills_dir))
+    try:
+        st = os.stat(skills_dir)
+    except OSError:
         print(f"❌ Error: Skills directory not found: {skills_dir}")
         return 1
 
+    if not stat.S_ISDIR(st.st_mode):
+        print(f"❌ Error: Skills path is not a directory: {skills_dir}")
+        return 1
+
+    # Import the scanner only now that arguments and paths are validated
+    try:
+        import skill_scanner
+    except ImportError:
+        print("❌ Error: skill_scanner library not found!")
+        print("   Install it with: pip install cisco-ai-skill-scanner")
+        return 1
+
+    # Reports already carry the details; don't repeat them into CI logs unless
+    # the run can fail, where the log should show why
+    quiet = args.quiet or (
+        args.format != "summary" and not sys.stdout.isatty() and not args.fail_on_findings
+    )
+
     print_banner()
     print(f"📁 Skills Directory: {skills_dir}")
     print(f"🔍 Recursive Scan: {args.recursive}")
 
     # Setup analyzers
-    analyzers = [StaticAnalyzer()]
     analyzer_names = ["Static (YAML+YARA)"]
 
     if args.use_behavioral:
-        analyzers.append(BehavioralAnalyzer(use_static_analysis=True))
         analyzer_names.append("Behavioral (Dataflow)")
 
+    use_llm = False
     if args.use_llm:
         api_key = os.getenv("SKILL_SCANNER_LLM_API_KEY")
         if not api_key:
@@ -334,28 +729,76 @@ def main():
             print("    Skipping LLM analyzer. Set environment variable to enable.")
         else:
             try:
-                from skill_scanner.core.analyzers.llm_analyzer import LLMAnalyzer
-                analyzers.append(LLMAnalyzer())
+                from skill_scanner.core.analyzers.llm_analyzer import LLMAnalyzer  # noqa: F401
+                use_llm = True
                 analyzer_names.append("LLM (Semantic)")
             except ImportError as e:
                 print(f"⚠️  Warning: Could not import LLM analyzer: {e}")
 
+    skills = discover_skills(skills_dir, args.recursive)
+
+    # Reuse cached results for skills whose location, files, analyzers and
+    # scanner version are unchanged (opt-in: entries are only as trustworthy
+    # as whoever can write the cache directory)
+    cache = SkillResultCache(Path(args.cache_dir), args.cache_ttl) if args.cache_dir else None
+    scan_results = [None] * len(skills)
+    fingerprints = [None] * len(skills)
+    if cache is not None:
+        analyzer_key = f"{skill_scanner.__version__}|{','.join(analyzer_names)}"
+        for i, skill in enumerate(skills):
+            try:
+                fingerprints[i] = skill_fingerprint(skill, skills_dir, analyzer_key)
+            except OSError as e:
+                print(f"⚠️  Warning: Not caching {skill.name}: {e}")
+                continue
+            scan_results[i] = cache.get(fingerprints[i])
+
+    pending = [i for i, result in enumerate(scan_results) if result is None]
+    pending_skills = [skills[i] for i in pending]
+    # LLM scans mostly wait on the network, so they get more workers than CPUs
+    default_jobs = args.llm_concurrency if use_llm else (os.cpu_count() or 1)
+    jobs = args.jobs or max(1, min(len(pending_skills), default_jobs))
+
     print(f"🔬 Analyzers: {', '.join(analyzer_names)}")
+    print(f"⚙️  Workers: {jobs}")
+    if cache is not None:
+        print(f"💾 Cached: {len(skills) - len(pending)} of {len(skills)} skills unchanged")
     print()
 
-    # Create scanner
-    scanner = SkillScanner(analyzers=analyzers)
-
-    # Scan directory
     print("🚀 Starting scan...\n")
     try:
-        report = scanner.scan_directory(skills_dir, recursive=args.recursive)
+        fresh_results = scan_skills(
+            pending_skills,
+            use_behavioral=args.use_behavioral,
+            use_llm=use_llm,
+            jobs=jobs,
+        )
     except Exception as e:
         print(f"❌ Error during scan: {e}")
         import traceback
         traceback.print_exc()
         return 1
 
+    for i, result in zip(pending, fresh_results):
+        scan_results[i] = result
+        if result is None:
+            continue
+        if cache is not None and fingerprints[i] is not None:
+            try:
+                cache.put(fingerprints[i], result)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"⚠️  Warning: Could not cache results for {skills[i].name}: {e}")
+
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"⚠️  Warning: Could not update result cache: {e}")
+
+    skipped_count = scan_results.count(None)
+    scan_results = [result for result in scan_results if result is not None]
+    report = aggregate_report(scan_results)
+
     # Print results
     print("=" * 80)
     print("SCAN RESULTS")
@@ -364,32 +807,36 @@ def main():
     print(f"Safe Skills: {report.safe_count} ✅")
     print(f"Unsafe Skills: {report.total_skills_scanned - report.safe_count} ⚠️")
     print(f"Total Findings: {report.total_findings}")
+    if skipped_count:
+        print(f"Skipped Skills: {skipped_count} ⏭️")
 
     if report.total_findings > 0:
         print("\nSeverity Breakdown:")
-        if report.critical_count > 0:
-            print(f"  🔴 CRITICAL: {report.critical_count}")
-        if report.high_count > 0:
-            print(f"  🟠 HIGH: {report.high_count}")
-        if report.medium_count > 0:
-            print(f"  🟡 MEDIUM: {report.medium_count}")
-        if report.low_count > 0:
-            print(f"  🔵 LOW: {report.low_count}")
-        if report.info_count > 0:
-            print(f"  ⚪ INFO: {report.info_count}")
-
-    # Print detailed results for each skill
-    print("\n" + "=" * 80)
-    print("DETAILED FINDINGS")
-    print("=" * 80)
-
-    for result in report.scan_results:
-        status = "✅ SAFE" if result.is_safe else "⚠️  UNSAFE"
-        print(f"\n📦 Skill: {result.skill_name} - {status}")
-        print(f"   Max Severity: {get_severity_emoji(result.max_severity)} {result.max_severity.value}")
-        print(f"   Total Findings: {len(result.findings)}")
-
-        print_finding_details(result)
+        histogram = report.severity_histogram
+        for label, emoji, _ in _SEV_ROWS:
+            count = histogram[label]
+            if count > 0:
+                print(_SEV_LINE_TMPL(emoji=emoji, label=label, count=count))
+
+    # Print detailed results for each skill (skipped in quiet mode)
+    if not quiet:
+        print("\n" + "=" * 80)
+        print("DETAILED FINDINGS")
+        print("=" * 80)
+
+        # Buffer each skill's block and emit it with one write
+        buf = []
+        _a = buf.append
+        for result in report.scan_results:
+            status = "✅ SAFE" if result.is_safe else "⚠️  UNSAFE"
+            _a(f"\n📦 Skill: {result.skill_name} - {status}\n")
+            max_severity = _SEV_STR[result.max_severity]
+            _a(f"   Max Severity: {_SEVERITY_EMOJI.get(max_severity, '❓')} {max_severity}\n")
+            _a(f"   Total Findings: {len(result.findings)}\n")
+
+            print_finding_details(result, buf)
+            sys.stdout.write("".join(buf))
+            buf.clear()
 
     # Print summary table
     print_summary_table(report)
@@ -406,7 +853,7 @@ def main():
 
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_json_report(report, output_path)
+        save_json_report(report, output_path, pretty=args.pretty_json)
 
     if args.format in ["markdown", "both"]:
         if args.output:
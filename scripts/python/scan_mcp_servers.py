@@ -23,24 +23,278 @@ Examples:
 """
 
 import asyncio
+import hashlib
 import json
+import mmap
+import os
 import sys
+import time
 import argparse
+from dataclasses import asdict, dataclass, field, is_dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 try:
     from mcpscanner import Config, Scanner
     from mcpscanner.core.models import AnalyzerEnum
-    from mcpscanner.core.exceptions import MCPScannerError
     from mcpscanner.core.mcp_models import StdioServer
-    from mcpscanner.core.auth import Auth, AuthType
 except ImportError:
     print("ERROR: mcpscanner library not found!")
     print("Install it with: pip install cisco-ai-mcp-scanner")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:  # optional: faster C (de)serializer, stdlib json otherwise
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib encoder can't handle natively."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize to JSON bytes (2-space indented or compact), using orjson when available."""
+    if orjson is not None:
+        # Non-string keys (e.g. enum members) are stringified like the json module does.
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, default=_json_default).encode()
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+class _ResultWriter:
+    """Stream scan results to disk as each server finishes.
+
+    The default format is a single JSON document with the same shape as a
+    whole-run dump; with ``ndjson`` every record (header, one per server,
+    summary) is written as its own line. Records go to a temporary file next
+    to ``path`` that replaces it only once the summary is written, so an
+    interrupted scan leaves any previous results untouched.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], ndjson: bool = False):
+        self.path = path
+        self.ndjson = ndjson
+        self._tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        self._f = open(self._tmp_path, 'wb')
+        self._first = True
+        self._complete = False
+        if ndjson:
+            self._f.write(_json_dumps({"type": "header", **header}, pretty=False) + b"\n")
+        else:
+            # Header fields, then open the "servers" object for entries to follow
+            self._f.write(_json_dumps(header, pretty=False)[:-1] + b',"servers":{')
+
+    def write_server(self, server_name: str, server_result: Dict[str, Any]):
+        """Append one server's result."""
+        if self.ndjson:
+            record = {"type": "server", "name": server_name, "result": server_result}
+            self._f.write(_json_dumps(record, pretty=False) + b"\n")
+            return
+        sep = b"\n" if self._first else b",\n"
+        self._first = False
+        self._f.write(sep + _json_dumps(server_name) + b": " + _json_dumps(server_result))
+
+    def write_summary(self, summary: Dict[str, Any]):
+        """Append the summary and terminate the document."""
+        if self.ndjson:
+            self._f.write(_json_dumps({"type": "summary", "summary": summary}, pretty=False) + b"\n")
+        else:
+            self._f.write(b'\n},\n"summary": ' + _json_dumps(summary) + b"}\n")
+        self._complete = True
+
+    def close(self):
+        """Move the finished file into place, or discard an incomplete one."""
+        self._f.close()
+        if self._complete:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+# Sentinel for optional attributes on scan-library result objects
+_MISSING = object()
+
+# Configs larger than this are memory-mapped and parsed in place rather than
+# read into an intermediate bytes copy
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _dedupe_key(server_config: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """Hashable identity of a server config, or None if it shouldn't be deduplicated."""
+    server_type = server_config.get("type")
+    try:
+        if server_type == "stdio":
+            env = server_config.get("env") or {}
+            return (
+                server_type,
+                server_config.get("command"),
+                tuple(server_config.get("args") or ()),
+                frozenset(env.items()),
+            )
+        if server_type == "http":
+            headers = server_config.get("headers") or {}
+            return (server_type, server_config.get("url"), frozenset(headers.items()))
+    except TypeError:  # unhashable values in args/env/headers
+        pass
+    return None
+
+
+def _cache_key(
+    server_config: Dict[str, Any],
+    analyzer_values: Tuple[str, ...],
+    summary_only: bool = False,
+) -> str:
+    """Cache key for a server: hash of its config, the analyzers and the output mode."""
+    # Stdlib json with sorted keys so the key doesn't depend on dict order or
+    # on whether orjson is installed
+    payload = json.dumps(
+        {"server": server_config, "analyzers": list(analyzer_values), "summary_only": summary_only},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+class ServerResultCache:
+    """Persistent per-server scan result cache with a freshness TTL.
+
+    Completed results are stored as JSON in ``<cache_dir>/<key>.json`` and
+    their tool records rebuilt on load; an entry whose file is older than
+    ``ttl`` seconds counts as a miss and is rescanned.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a key, or None if missing or stale."""
+        path = self._entry_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            result = _json_loads(path.read_bytes())
+            result["tools"] = [_tool_record_from_dict(tool) for tool in result["tools"]]
+            return result
+        except Exception:
+            # Missing or unreadable entry (e.g. written by another script version)
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a freshly scanned result."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entry_path(key).write_bytes(_json_dumps(result, pretty=False))
+
+
+@dataclass(slots=True)
+class FindingRecord:
+    """One security finding on a tool (orjson serializes dataclasses natively)."""
+
+    severity: str
+    category: Optional[str]
+    description: str
+    threat_names: List[str]
+
+
+@dataclass(slots=True)
+class ToolRecord:
+    """Scan outcome for a single tool."""
+
+    name: str
+    description: str
+    is_safe: bool
+    status: str
+    findings: List[FindingRecord] = field(default_factory=list)
+    analyzer_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _tool_record_from_dict(data: Dict[str, Any]) -> ToolRecord:
+    """Rebuild a ToolRecord (and its findings) from its JSON form."""
+    return ToolRecord(**{**data, "findings": [FindingRecord(**f) for f in data["findings"]]})
+
+
+def _process_tool_results(tool_results: List[Any]) -> Tuple[List[ToolRecord], int, int, int]:
+    """Process tool scan results into a serializable format.
+
+    Returns:
+        Tuple of (processed tools, safe tool count, unsafe tool count,
+        total findings), counted in the same pass that builds the tools
+    """
+    processed = []
+    safe_count = 0
+    findings_count = 0
+
+    for tool_result in tool_results:
+        tool_data = ToolRecord(
+            name=tool_result.tool_name,
+            description=tool_result.tool_description,
+            is_safe=tool_result.is_safe,
+            status=tool_result.status,
+        )
+
+        # Process findings (one getattr per optional attribute instead of
+        # a hasattr probe followed by a second lookup)
+        for finding in tool_result.findings:
+            severity = finding.severity
+            severity_value = getattr(severity, 'value', _MISSING)
+            description = getattr(finding, 'description', _MISSING)
+            tool_data.findings.append(FindingRecord(
+                severity=str(severity) if severity_value is _MISSING else severity_value,
+                category=getattr(finding, 'category', None),
+                description=finding.summary if description is _MISSING else description,
+                threat_names=getattr(finding, 'threat_names', []),
+            ))
+
+        # Process analyzer-specific results
+        analyzer_results = getattr(tool_result, 'analyzer_results', None)
+        if analyzer_results:
+            for analyzer_name, analyzer_result in analyzer_results.items():
+                analyzer_findings = getattr(analyzer_result, 'findings', None)
+                tool_data.analyzer_results[analyzer_name] = {
+                    "is_safe": getattr(analyzer_result, 'is_safe', True),
+                    "findings_count": 0 if analyzer_findings is None else len(analyzer_findings),
+                }
+
+        processed.append(tool_data)
+        if tool_data.is_safe:
+            safe_count += 1
+        findings_count += len(tool_data.findings)
+
+    return processed, safe_count, len(processed) - safe_count, findings_count
+
+
+def _summarize_tool_results(tool_results: List[Any]) -> Tuple[int, int, int]:
+    """Count (safe tools, unsafe tools, total findings) without building records."""
+    safe_count = 0
+    findings_count = 0
+    for tool_result in tool_results:
+        if tool_result.is_safe:
+            safe_count += 1
+        findings_count += len(tool_result.findings)
+    return safe_count, len(tool_results) - safe_count, findings_count
+
 
 class MCPSecurityScanner:
     """Comprehensive MCP server security scanner."""
@@ -51,6 +305,11 @@ class MCPSecurityScanner:
         analyzers: List[AnalyzerEnum],
         api_key: Optional[str] = None,
         llm_api_key: Optional[str] = None,
+        max_parallel: int = 8,
+        batch_size: Optional[int] = None,
+        dedupe: bool = True,
+        cache: Optional[ServerResultCache] = None,
+        summary_only: bool = False,
     ):
         """Initialize the scanner.
 
@@ -59,9 +318,25 @@ class MCPSecurityScanner:
             analyzers: List of analyzers to use
             api_key: Optional Cisco AI Defense API key
             llm_api_key: Optional LLM provider API key
+            max_parallel: Maximum number of servers scanned concurrently
+            batch_size: Number of servers submitted per wave (default: all at once)
+            dedupe: Scan servers with identical configs once and reuse the result
+            cache: Persistent cache of completed results for unchanged servers
+            summary_only: Only count tools and findings; don't record per-tool details
         """
         self.config_path = config_path
         self.analyzers = analyzers
+        self._analyzer_values = tuple(a.value for a in analyzers)
+        self.max_parallel = max(1, max_parallel)
+        self.batch_size = batch_size
+        self.dedupe = dedupe
+        self.cache = cache
+        self.summary_only = summary_only
+        # Scan method per server "type"; anything else is skipped
+        self._dispatch_map = {
+            "stdio": self.scan_stdio_server,
+            "http": self.scan_http_server,
+        }
         self.mcp_config = self._load_mcp_config()
 
         # Create scanner configuration
@@ -69,14 +344,17 @@ class MCPSecurityScanner:
             api_key=api_key,
             llm_provider_api_key=llm_api_key,
         )
+        # One Scanner serves every server in the run so whatever clients and
+        # connections it holds are reused. mcpscanner's Config has no hook for
+        # injecting a pooled HTTP client.
         self.scanner = Scanner(scanner_config)
 
         # Results storage
         self.results: Dict[str, Any] = {
-            "scan_timestamp": datetime.now().isoformat(),
+            # Integer epoch nanoseconds; formatted for display only in print_summary
+            "scan_timestamp_ns": time.time_ns(),
             "config_file": str(config_path),
-            "analyzers_used": [a.value for a in analyzers],
-            "servers": {},
+            "analyzers_used": list(self._analyzer_values),
             "summary": {
                 "total_servers": 0,
                 "scanned_servers": 0,
@@ -87,12 +365,24 @@ class MCPSecurityScanner:
                 "total_findings": 0,
             },
         }
+        # Per-server results are streamed to disk; only unsafe tools are kept
+        # in memory for the summary
+        self.unsafe_tools: Dict[str, List[Dict[str, Any]]] = {}
 
     def _load_mcp_config(self) -> Dict[str, Any]:
         """Load MCP configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            config = orjson.loads(view)
+                        finally:
+                            # The map can't close while an export is alive
+                            view.release()
+                else:
+                    config = _json_loads(f.read())
                 if "mcpServers" not in config:
                     raise ValueError("Invalid MCP config: missing 'mcpServers' key")
                 return config
@@ -113,14 +403,22 @@ class MCPSecurityScanner:
         Returns:
             Scan results for this server
         """
-        print(f"\n📡 Scanning stdio server: {server_name}")
-        print(f"   Command: {server_config.get('command')}")
-        print(f"   Args: {server_config.get('args', [])}")
+        command = server_config.get("command")
+        args = server_config.get("args") or []
+        env = server_config.get("env")
+
+        # Buffer this server's console block and emit it with one write once
+        # the scan finishes, so concurrent scans don't interleave lines
+        out = []
+        _a = out.append
+        _a(f"\n📡 Scanning stdio server: {server_name}\n")
+        _a(f"   Command: {command}\n")
+        _a(f"   Args: {args}\n")
 
         result = {
             "server_type": "stdio",
-            "command": server_config.get("command"),
-            "args": server_config.get("args", []),
+            "command": command,
+            "args": args,
             "status": "pending",
             "tools": [],
             "error": None,
@@ -128,10 +426,11 @@ class MCPSecurityScanner:
 
         try:
             # Create StdioServer configuration
+            # Copy args so the StdioServer doesn't share a list with the result
             stdio_server = StdioServer(
-                command=server_config["command"],
-                args=server_config.get("args", []),
-                env=server_config.get("env"),
+                command=command,
+                args=list(args),
+                env=env,
             )
 
             # Scan tools from stdio server
@@ -140,20 +439,23 @@ class MCPSecurityScanner:
                 analyzers=self.analyzers,
             )
 
+            # Pure-Python conversion; keep it off the event loop so other scans progress
+            tools, safe_count, unsafe_count, findings_count = await self._convert_tool_results(tool_results)
             result["status"] = "completed"
-            result["tools"] = self._process_tool_results(tool_results)
+            result["tools"] = tools
+            result["safe_tools"] = safe_count
+            result["unsafe_tools"] = unsafe_count
+            result["total_findings"] = findings_count
 
-            safe_count = sum(1 for t in result["tools"] if t["is_safe"])
-            unsafe_count = len(result["tools"]) - safe_count
-
-            print(f"   ✅ Scanned {len(result['tools'])} tools")
-            print(f"      Safe: {safe_count}, Unsafe: {unsafe_count}")
+            _a(f"   ✅ Scanned {safe_count + unsafe_count} tools\n")
+            _a(f"      Safe: {safe_count}, Unsafe: {unsafe_count}\n")
 
         except Exception as e:
             result["status"] = "failed"
             result["error"] = str(e)
-            print(f"   ❌ Scan failed: {e}")
+            _a(f"   ❌ Scan failed: {e}\n")
 
+        sys.stdout.write("".join(out))
         return result
 
     async def scan_http_server(self, server_name: str, server_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -166,12 +468,18 @@ class MCPSecurityScanner:
         Returns:
             Scan results for this server
         """
-        print(f"\n📡 Scanning HTTP server: {server_name}")
-        print(f"   URL: {server_config.get('url')}")
+        url = server_config.get("url")
+        headers = server_config.get("headers") or {}
+
+        # Buffer this server's console block and emit it with one write
+        out = []
+        _a = out.append
+        _a(f"\n📡 Scanning HTTP server: {server_name}\n")
+        _a(f"   URL: {url}\n")
 
         result = {
             "server_type": "http",
-            "url": server_config.get("url"),
+            "url": url,
             "status": "pending",
             "tools": [],
             "error": None,
@@ -180,94 +488,208 @@ class MCPSecurityScanner:
         try:
             # Extract bearer token from headers if present
             auth = None
-            headers = server_config.get("headers", {})
-            if "Authorization" in headers:
-                auth_header = headers["Authorization"]
-                if auth_header.startswith("Bearer "):
-                    bearer_token = auth_header.replace("Bearer ", "")
-                    auth = Auth(
-                        auth_type=AuthType.BEARER,
-                        bearer_token=bearer_token,
-                    )
+            auth_header = headers.get("Authorization", "")
+            # Strip only the leading scheme; a token containing "Bearer " stays intact
+            bearer_token = auth_header.removeprefix("Bearer ") if auth_header.startswith("Bearer ") else None
+            if bearer_token:
+                # Only bearer-authenticated HTTP servers need the auth models
+                from mcpscanner.core.auth import Auth, AuthType
+
+                auth = Auth(
+                    auth_type=AuthType.BEARER,
+                    bearer_token=bearer_token,
+                )
 
             # Scan tools from HTTP server
             tool_results = await self.scanner.scan_remote_server_tools(
-                server_url=server_config["url"],
+                server_url=url,
                 analyzers=self.analyzers,
                 auth=auth,
             )
 
+            # Pure-Python conversion; keep it off the event loop so other scans progress
+            tools, safe_count, unsafe_count, findings_count = await self._convert_tool_results(tool_results)
             result["status"] = "completed"
-            result["tools"] = self._process_tool_results(tool_results)
-
-            safe_count = sum(1 for t in result["tools"] if t["is_safe"])
-            unsafe_count = len(result["tools"]) - safe_count
+            result["tools"] = tools
+            result["safe_tools"] = safe_count
+            result["unsafe_tools"] = unsafe_count
+            result["total_findings"] = findings_count
 
-            print(f"   ✅ Scanned {len(result['tools'])} tools")
-            print(f"      Safe: {safe_count}, Unsafe: {unsafe_count}")
+            _a(f"   ✅ Scanned {safe_count + unsafe_count} tools\n")
+            _a(f"      Safe: {safe_count}, Unsafe: {unsafe_count}\n")
 
         except Exception as e:
             result["status"] = "failed"
             result["error"] = str(e)
-            print(f"   ❌ Scan failed: {e}")
+            _a(f"   ❌ Scan failed: {e}\n")
 
+        sys.stdout.write("".join(out))
         return result
 
-    def _process_tool_results(self, tool_results: List[Any]) -> List[Dict[str, Any]]:
-        """Process tool scan results into a serializable format."""
-        processed = []
-
-        for tool_result in tool_results:
-            tool_data = {
-                "name": tool_result.tool_name,
-                "description": tool_result.tool_description,
-                "is_safe": tool_result.is_safe,
-                "status": tool_result.status,
-                "findings": [],
-                "analyzer_results": {},
-            }
-
-            # Process findings
-            for finding in tool_result.findings:
-                tool_data["findings"].append({
-                    "severity": finding.severity.value if hasattr(finding.severity, 'value') else str(finding.severity),
-                    "category": finding.category if hasattr(finding, 'category') else None,
-                    "description": finding.description if hasattr(finding, 'description') else finding.summary,
-                    "threat_names": finding.threat_names if hasattr(finding, 'threat_names') else [],
-                })
-
-            # Process analyzer-specific results
-            if hasattr(tool_result, 'analyzer_results'):
-                for analyzer_name, analyzer_result in tool_result.analyzer_results.items():
-                    tool_data["analyzer_results"][analyzer_name] = {
-                        "is_safe": analyzer_result.is_safe if hasattr(analyzer_result, 'is_safe') else True,
-                        "findings_count": len(analyzer_result.findings) if hasattr(analyzer_result, 'findings') else 0,
-                    }
+    async def _convert_tool_results(
+        self, tool_results: List[Any]
+    ) -> Tuple[List[ToolRecord], int, int, int]:
+        """Run _process_tool_results on a worker thread.
 
-            processed.append(tool_data)
+        In summary-only mode no records are built, just the counts.
+        """
+        if self.summary_only:
+            return ([], *_summarize_tool_results(tool_results))
+        return await asyncio.to_thread(_process_tool_results, tool_results)
 
-        return processed
+    async def scan_all_servers(self, output_path: Path, ndjson: bool = False):
+        """Scan all servers defined in the MCP configuration.
 
-    async def scan_all_servers(self):
-        """Scan all servers defined in the MCP configuration."""
-        print("=" * 80)
-        print("🔒 MCP SERVER SECURITY SCANNER")
-        print("=" * 80)
-        print(f"\nConfiguration: {self.config_path}")
-        print(f"Analyzers: {', '.join(a.value for a in self.analyzers)}")
-        print(f"Servers to scan: {len(self.mcp_config['mcpServers'])}")
-        print("=" * 80)
+        Args:
+            output_path: File that results are streamed to as servers finish
+            ndjson: Write one JSON record per line instead of a single document
+        """
+        out = []
+        _a = out.append
+        _a("=" * 80 + "\n")
+        _a("🔒 MCP SERVER SECURITY SCANNER\n")
+        _a("=" * 80 + "\n")
+        _a(f"\nConfiguration: {self.config_path}\n")
+        _a(f"Analyzers: {', '.join(self._analyzer_values)}\n")
+        _a(f"Servers to scan: {len(self.mcp_config['mcpServers'])}\n")
+        _a("=" * 80 + "\n")
+        sys.stdout.write("".join(out))
 
         self.results["summary"]["total_servers"] = len(self.mcp_config["mcpServers"])
 
-        for server_name, server_config in self.mcp_config["mcpServers"].items():
-            server_type = server_config.get("type", "unknown")
+        # Scans are I/O-bound (subprocesses / network), so run them concurrently.
+        # The semaphore bounds scans in flight; batches bound how many tasks
+        # (and their results) exist at once for very large configs.
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        servers, aliases = self._group_servers()
+
+        header = {k: v for k, v in self.results.items() if k != "summary"}
+        writer = _ResultWriter(output_path, header, ndjson)
+        try:
+            # Servers with a fresh cached result are recorded up front and
+            # never scheduled
+            cache_keys: Dict[str, str] = {}
+            if self.cache is not None:
+                to_scan = []
+                for server_name, server_config in servers:
+                    key = _cache_key(server_config, self._analyzer_values, self.summary_only)
+                    cached = self.cache.get(key)
+                    if cached is None:
+                        cache_keys[server_name] = key
+                        to_scan.append((server_name, server_config))
+                        continue
+                    print(f"\n♻️  {server_name}: unchanged since last scan, using cached results")
+                    self._record_with_aliases(server_name, cached, aliases, writer)
+                servers = to_scan
+
+            batch_size = self.batch_size if self.batch_size and self.batch_size > 0 else len(servers)
+            for start in range(0, len(servers), batch_size or 1):
+                tasks = [
+                    asyncio.create_task(self._dispatch(server_name, server_config, semaphore))
+                    for server_name, server_config in servers[start:start + batch_size]
+                ]
+
+                # Record each server as soon as it finishes rather than waiting on
+                # the slowest one in the batch
+                for next_done in asyncio.as_completed(tasks):
+                    server_name, server_result = await next_done
+                    self._record_with_aliases(server_name, server_result, aliases, writer)
+                    if server_name in cache_keys and server_result["status"] == "completed":
+                        try:
+                            self.cache.put(cache_keys[server_name], server_result)
+                        except OSError as e:
+                            print(f"⚠️  Warning: Could not cache results for {server_name}: {e}")
+
+            writer.write_summary(self.results["summary"])
+        finally:
+            writer.close()
+
+    def _group_servers(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, List[str]]]:
+        """Collapse servers with identical configs.
+
+        Returns:
+            Tuple of (servers to scan, mapping of scanned server name to the
+            names of aliases that share its config)
+        """
+        servers = self.mcp_config["mcpServers"]
+        if not self.dedupe:
+            return list(servers.items()), {}
+
+        unique: List[Tuple[str, Dict[str, Any]]] = []
+        aliases: Dict[str, List[str]] = {}
+        first_by_key: Dict[Any, str] = {}
+        for server_name, server_config in servers.items():
+            key = _dedupe_key(server_config)
+            if key is not None and key in first_by_key:
+                aliases.setdefault(first_by_key[key], []).append(server_name)
+                continue
+            if key is not None:
+                first_by_key[key] = server_name
+            unique.append((server_name, server_config))
+        return unique, aliases
+
+    def _record_with_aliases(
+        self,
+        server_name: str,
+        server_result: Dict[str, Any],
+        aliases: Dict[str, List[str]],
+        writer: _ResultWriter,
+    ):
+        """Record a server's result, then a copy for each alias sharing its config."""
+        self._record_server_result(server_name, server_result, writer)
+        for alias in aliases.get(server_name, ()):
+            print(f"\n♻️  {alias}: same config as {server_name}, reusing its results")
+            self._record_server_result(
+                alias, {**server_result, "duplicate_of": server_name}, writer
+            )
+
+    def _record_server_result(
+        self,
+        server_name: str,
+        server_result: Dict[str, Any],
+        writer: _ResultWriter,
+    ):
+        """Write a server's result and fold it into the summary statistics."""
+        server_result["completed_ns"] = time.time_ns()
+        writer.write_server(server_name, server_result)
 
+        unsafe_tools = [t for t in server_result.get("tools", []) if not t.is_safe]
+        if unsafe_tools:
+            self.unsafe_tools[server_name] = unsafe_tools
+
+        summary = self.results["summary"]
+        if server_result["status"] == "completed":
+            summary["scanned_servers"] += 1
+            summary["total_tools"] += server_result["safe_tools"] + server_result["unsafe_tools"]
+            summary["safe_tools"] += server_result["safe_tools"]
+            summary["unsafe_tools"] += server_result["unsafe_tools"]
+            summary["total_findings"] += server_result["total_findings"]
+        elif server_result["status"] in ("failed", "error"):
+            summary["failed_servers"] += 1
+
+    async def _dispatch(
+        self,
+        server_name: str,
+        server_config: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Scan one server according to its type.
+
+        Args:
+            server_name: Name of the server
+            server_config: Server configuration dict
+            semaphore: Limits how many servers are scanned at once
+
+        Returns:
+            Tuple of server name and its scan results
+        """
+        server_type = server_config.get("type", "unknown")
+        handler = self._dispatch_map.get(server_type)
+
+        async with semaphore:
             try:
-                if server_type == "stdio":
-                    server_result = await self.scan_stdio_server(server_name, server_config)
-                elif server_type == "http":
-                    server_result = await self.scan_http_server(server_name, server_config)
+                if handler is not None:
+                    server_result = await handler(server_name, server_config)
                 else:
                     print(f"\n⚠️  Skipping {server_name}: unsupported type '{server_type}'")
                     server_result = {
@@ -276,81 +698,63 @@ class MCPSecurityScanner:
                         "error": f"Unsupported server type: {server_type}",
                         "tools": [],
                     }
-
-                self.results["servers"][server_name] = server_result
-
-                # Update summary statistics
-                if server_result["status"] == "completed":
-                    self.results["summary"]["scanned_servers"] += 1
-                    self.results["summary"]["total_tools"] += len(server_result["tools"])
-                    self.results["summary"]["safe_tools"] += sum(
-                        1 for t in server_result["tools"] if t["is_safe"]
-                    )
-                    self.results["summary"]["unsafe_tools"] += sum(
-                        1 for t in server_result["tools"] if not t["is_safe"]
-                    )
-                    self.results["summary"]["total_findings"] += sum(
-                        len(t["findings"]) for t in server_result["tools"]
-                    )
-                elif server_result["status"] == "failed":
-                    self.results["summary"]["failed_servers"] += 1
-
             except Exception as e:
                 print(f"\n❌ Unexpected error scanning {server_name}: {e}")
-                self.results["servers"][server_name] = {
+                server_result = {
                     "status": "error",
                     "error": str(e),
                     "tools": [],
                 }
-                self.results["summary"]["failed_servers"] += 1
+
+        return server_name, server_result
 
     def print_summary(self):
-        """Print scan summary."""
-        print("\n" + "=" * 80)
-        print("📊 SCAN SUMMARY")
-        print("=" * 80)
+        """Print scan summary (collected and written to stdout in one call)."""
+        out = []
+        _a = out.append
+        _a("\n" + "=" * 80 + "\n")
+        _a("📊 SCAN SUMMARY\n")
+        _a("=" * 80 + "\n")
+
+        started = datetime.fromtimestamp(self.results["scan_timestamp_ns"] / 1e9)
+        _a(f"\nStarted: {started.isoformat(timespec='seconds')}\n")
 
         summary = self.results["summary"]
-        print(f"\nServers:")
-        print(f"  Total:    {summary['total_servers']}")
-        print(f"  Scanned:  {summary['scanned_servers']}")
-        print(f"  Failed:   {summary['failed_servers']}")
+        _a("\nServers:\n")
+        _a(f"  Total:    {summary['total_servers']}\n")
+        _a(f"  Scanned:  {summary['scanned_servers']}\n")
+        _a(f"  Failed:   {summary['failed_servers']}\n")
 
-        print(f"\nTools:")
-        print(f"  Total:    {summary['total_tools']}")
-        print(f"  ✅ Safe:    {summary['safe_tools']}")
-        print(f"  ⚠️  Unsafe:  {summary['unsafe_tools']}")
+        _a("\nTools:\n")
+        _a(f"  Total:    {summary['total_tools']}\n")
+        _a(f"  ✅ Safe:    {summary['safe_tools']}\n")
+        _a(f"  ⚠️  Unsafe:  {summary['unsafe_tools']}\n")
 
-        print(f"\nFindings:")
-        print(f"  Total security findings: {summary['total_findings']}")
+        _a("\nFindings:\n")
+        _a(f"  Total security findings: {summary['total_findings']}\n")
 
         # List unsafe tools
         if summary['unsafe_tools'] > 0:
-            print("\n" + "=" * 80)
-            print("⚠️  UNSAFE TOOLS DETECTED")
-            print("=" * 80)
-
-            for server_name, server_result in self.results["servers"].items():
-                unsafe_tools = [t for t in server_result.get("tools", []) if not t["is_safe"]]
-                if unsafe_tools:
-                    print(f"\n🔴 Server: {server_name}")
-                    for tool in unsafe_tools:
-                        print(f"   • {tool['name']}")
-                        print(f"     Status: {tool['status']}")
-                        print(f"     Findings: {len(tool['findings'])}")
-                        for finding in tool['findings'][:3]:  # Show first 3 findings
-                            print(f"       - [{finding['severity']}] {finding['description'][:80]}...")
-                        if len(tool['findings']) > 3:
-                            print(f"       ... and {len(tool['findings']) - 3} more findings")
-
-    def save_results(self, output_path: Path):
-        """Save scan results to JSON file."""
-        try:
-            with open(output_path, 'w') as f:
-                json.dump(self.results, f, indent=2)
-            print(f"\n💾 Results saved to: {output_path}")
-        except Exception as e:
-            print(f"\n❌ Failed to save results: {e}")
+            _a("\n" + "=" * 80 + "\n")
+            _a("⚠️  UNSAFE TOOLS DETECTED\n")
+            _a("=" * 80 + "\n")
+
+            if self.summary_only:
+                _a("\nPer-tool details not collected (--summary-only); "
+                   "see per-server counts in the results file\n")
+
+            for server_name, unsafe_tools in self.unsafe_tools.items():
+                _a(f"\n🔴 Server: {server_name}\n")
+                for tool in unsafe_tools:
+                    _a(f"   • {tool.name}\n")
+                    _a(f"     Status: {tool.status}\n")
+                    _a(f"     Findings: {len(tool.findings)}\n")
+                    for finding in tool.findings[:3]:  # Show first 3 findings
+                        _a(f"       - [{finding.severity}] {finding.description[:80]}...\n")
+                    if len(tool.findings) > 3:
+                        _a(f"       ... and {len(tool.findings) - 3} more findings\n")
+
+        sys.stdout.write("".join(out))
 
 
 async def main():
@@ -387,6 +791,56 @@ async def main():
         help="Path to save JSON results (default: mcp_scan_results.json)",
     )
 
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only record per-server and overall counts, not per-tool findings",
+    )
+
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Write results as newline-delimited JSON (one record per line)",
+    )
+
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=8,
+        help="Maximum number of servers to scan concurrently (default: 8)",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Submit server scans in waves of this size (default: all at once)",
+    )
+
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Scan every server entry, even when several share an identical config",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse completed results for unchanged servers from this directory (default: no cache)",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=86400,
+        help="Seconds a cached server result stays valid (default: 86400)",
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print the full traceback if the scan fails",
+    )
+
     parser.add_argument(
         "--api-key",
         type=str,
@@ -426,17 +880,20 @@ async def main():
         analyzers=analyzers,
         api_key=args.api_key,
         llm_api_key=args.llm_api_key,
+        max_parallel=args.max_parallel,
+        batch_size=args.batch_size,
+        dedupe=not args.no_dedupe,
+        cache=ServerResultCache(args.cache_dir, args.cache_ttl) if args.cache_dir else None,
+        summary_only=args.summary_only,
     )
 
     try:
-        # Run scan
-        await scanner.scan_all_servers()
+        # Run scan, streaming results to the output file
+        await scanner.scan_all_servers(args.output, ndjson=args.ndjson)
 
         # Print summary
         scanner.print_summary()
-
-        # Save results
-        scanner.save_results(args.output)
+        print(f"\n💾 Results saved to: {args.output}")
 
         print("\n" + "=" * 80)
         print("✅ Scan completed successfully!")
@@ -447,8 +904,11 @@ async def main():
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Scan failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        else:
+            print("   (run with --debug for the full traceback)")
         sys.exit(1)
 
 